@@ -1,22 +1,42 @@
-import re
 import os
+import ast
 import sys
-from pathlib import Path
-from setuptools import setup
+import json
 
 
 def find_version(filename):
-    _version_re = re.compile(r"__version__ = ['\"](.*)['\"]")
-    last = None  # match python semantics
-    for line in open(filename):
-        version_match = _version_re.match(line)
-        if version_match:
-            last = version_match.group(1)
+    # ast.parse accepts bytes directly and handles source decoding itself
+    with open(filename, 'rb') as f:
+        tree = ast.parse(f.read())
 
-    return last
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and
+            any(t.id == '__version__' for t in node.targets
+                if isinstance(t, ast.Name))):
+            return node.value.value
 
 
-__version__ = find_version('sparcur/__init__.py')
+def cached_version(filename, cache='build/.sparcur_version_cache'):
+    """ skip re-parsing filename if it has not changed since the last run """
+    mtime = os.stat(filename).st_mtime_ns
+    try:
+        with open(cache, 'rt') as f:
+            cache_mtime, version = json.load(f)
+
+        if cache_mtime == mtime:
+            return version
+    except (OSError, ValueError, TypeError):
+        pass
+
+    version = find_version(filename)
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        with open(cache, 'wt') as f:
+            json.dump([mtime, version], f)
+    except OSError:
+        pass  # read only checkout or build is not a directory, cache is optional
+
+    return version
 
 
 def tangle_files(*files):
@@ -43,11 +63,28 @@ def fix_relative_links(md):
     return md.replace('](./', f'](https://github.com/{group}/{repo}/blob/master/')
 
 
-with open('README.md', 'rt') as f:
-    long_description = fix_relative_links(f.read())
+def long_desc():
+    with open('README.md', 'rt', encoding='utf-8') as f:
+        return fix_relative_links(f.read())
+
+
+# invocations that never use the long description, anything else reads it
+NO_LONG_DESCRIPTION = {
+    '--version', '--name', '--fullname', '--author', '--author-email',
+    '--maintainer', '--maintainer-email', '--contact', '--contact-email',
+    '--url', '--license', '--licence', '--description', '--keywords',
+    '--platforms', '--classifiers', '--provides', '--requires',
+    '--obsoletes', '--help', '-h', '--help-commands', 'clean'}
+
+CRON_REQUIRES = ('celery', 'redis')
+TESTS_REQUIRE = ('pytest',) + CRON_REQUIRES
+EXTRAS_REQUIRE = {'dev': ('wheel',),
+                  'filetypes': ('nibabel', 'pydicom', 'scipy'),
+                  'cron': CRON_REQUIRES,
+                  'test': TESTS_REQUIRE}
 
 RELEASE = '--release' in sys.argv
-NEED_SIMPLE = not Path('sparcur', 'simple').exists()
+NEED_SIMPLE = not os.path.exists(os.path.join('sparcur', 'simple'))
 if RELEASE or NEED_SIMPLE:
     if RELEASE:
         sys.argv.remove('--release')
@@ -55,60 +92,41 @@ if RELEASE or NEED_SIMPLE:
     tangle_files(
         './docs/developer-guide.org',)
 
-cron_requires = ['celery', 'redis']
-tests_require = ['pytest', 'pytest-runner'] + cron_requires
-setup(name='sparcur',
-      version=__version__,
-      description='assorted',
-      long_description=long_description,
-      long_description_content_type='text/markdown',
-      url='https://github.com/SciCrunch/sparc-curation',
-      author='Tom Gillespie',
-      author_email='tgbugs@gmail.com',
-      license='MIT',
-      classifiers=[
-          'Development Status :: 3 - Alpha',
-          'License :: OSI Approved :: MIT License',
-          'Programming Language :: Python :: 3.6',
-          'Programming Language :: Python :: 3.7',
-          'Programming Language :: Python :: 3.8',
-          'Programming Language :: Python :: 3.9',
-          'Programming Language :: Python :: 3.10',
-          'Programming Language :: Python :: 3.11',
-          'Programming Language :: Python :: Implementation :: CPython',
-          'Programming Language :: Python :: Implementation :: PyPy',
-          'Operating System :: POSIX :: Linux',
-          'Operating System :: MacOS :: MacOS X',
-          'Operating System :: Microsoft :: Windows',
-      ],
-      keywords='SPARC curation biocuration ontology pennsieve protc protocols hypothesis',
-      packages=['sparcur', 'sparcur.export', 'sparcur.extract', 'sparcur.sparcron', 'sparcur.simple'],
-      python_requires='>=3.6',
-      tests_require=tests_require,
-      install_requires=[
-          'augpathlib>=0.0.27',
-          'beautifulsoup4',
-          'pennsieve',
-          'dicttoxml',
-          "ipython; python_version < '3.7'",
-          'jsonschema>=3.0.1',  # need the draft 6 validator
-          'ontquery>=0.2.8',
-          'openpyxl',
-          'protcur>=0.0.11',
-          'pyontutils>=0.1.32',
-          'pysercomb>=0.0.11',
-          'terminaltables',
-          'xlsx2csv',
-      ],
-      extras_require={'dev': ['wheel'],
-                      'filetypes': ['nibabel', 'pydicom', 'scipy'],
-                      'cron': cron_requires,
-                      'test': tests_require},
-      scripts=[],
-      entry_points={
-          'console_scripts': [
-              'spc=sparcur.cli:main',
-          ],
-      },
-      data_files=[('share/sparcur/resources/', ['resources/mimetypes.json']),],
-)
+
+if __name__ == '__main__':
+    from setuptools import setup
+
+    __version__ = cached_version('sparcur/__init__.py')
+    if sys.argv[1:] and set(sys.argv[1:]) <= NO_LONG_DESCRIPTION:
+        long_description = ''
+    else:
+        long_description = long_desc()
+
+    setup(version=__version__,
+          long_description=long_description,
+          include_package_data=False,
+          zip_safe=False,
+          packages=('sparcur', 'sparcur.export', 'sparcur.extract', 'sparcur.sparcron', 'sparcur.simple'),
+          install_requires=(
+              'augpathlib>=0.0.27',
+              'beautifulsoup4',
+              'pennsieve',
+              'dicttoxml',
+              'jsonschema>=3.0.1',  # need the draft 6 validator
+              'ontquery>=0.2.8',
+              'openpyxl',
+              'protcur>=0.0.11',
+              'pyontutils>=0.1.32',
+              'pysercomb>=0.0.11',
+              'terminaltables',
+              'xlsx2csv',
+          ),
+          extras_require=EXTRAS_REQUIRE,
+          scripts=[],
+          entry_points={
+              'console_scripts': [
+                  'spc=sparcur.cli:main',
+              ],
+          },
+          data_files=[('share/sparcur/resources/', ['resources/mimetypes.json']),],
+    )
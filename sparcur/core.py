@@ -330,6 +330,19 @@ def lj(j, limit=100):
         return out
 
 
+class LazyLJ:
+    """ lj for log calls whose level is usually disabled, logging only
+        calls str on the message once a record is actually emitted so
+        log.debug(LazyLJ(blob)) does not serialize blob otherwise """
+
+    def __init__(self, j, limit=100):
+        self.j = j
+        self.limit = limit
+
+    def __str__(self):
+        return lj(self.j, limit=self.limit)
+
+
 def dereference_all_identifiers(obj, stage, *args, path=None, addError=None, **kwargs):
     try:
         dict_literal = _json_identifier_expansion(obj)
@@ -452,37 +465,47 @@ def json_identifier_expansion(obj, *args, path=None, **kwargs):
         return out
 
 
-def json_export_type_converter(obj):
-    if isinstance(obj, deque):
-        return list(obj)
-    elif isinstance(obj, AJ):
-        return obj.asJson()
-    elif isinstance(obj, ProtcurExpression):
-        return obj.json()
-    elif isinstance(obj, PurePath):
-        return obj.as_posix()
-    elif isinstance(obj, Quantity):
-        return obj.json()
-    elif isinstance(obj, Measurement):
-        return obj.json()
-    elif isinstance(obj, oq.OntTerm):
-        return obj.iri
-        #return obj.asDict()  # FIXME need a no network/scigraph version
-    elif isinstance(obj, idlib.Stream) and hasattr(obj, '_id_class'):
+def _stream_converter(obj):
+    if hasattr(obj, '_id_class'):
         if obj._id_class is str:
             return obj.identifier
         else:
             return json_export_type_converter(obj.identifier)
             #return obj.asDict()  # FIXME need a no network/scigraph version
-    elif isinstance(obj, datetime):
-        return isoformat(obj)
-    elif isinstance(obj, date):
-        return isoformat(obj)
-    elif isinstance(obj, time):
-        return isoformat(obj)
-    elif isinstance(obj, BaseException):
-        # FIXME hunt down where these are sneeking in from
-        return repr(obj)
+
+
+# order matters, the first isinstance match wins
+_json_export_converters = (
+    (deque, list),
+    (AJ, lambda obj: obj.asJson()),
+    (ProtcurExpression, lambda obj: obj.json()),
+    (PurePath, lambda obj: obj.as_posix()),
+    (Quantity, lambda obj: obj.json()),
+    (Measurement, lambda obj: obj.json()),
+    (oq.OntTerm, lambda obj: obj.iri),  # FIXME asDict needs a no network/scigraph version
+    (idlib.Stream, _stream_converter),
+    (datetime, isoformat),
+    (date, isoformat),
+    (time, isoformat),
+    # FIXME hunt down where these are sneeking in from
+    (BaseException, repr),
+)
+_json_export_converter_cache = {}
+
+
+def json_export_type_converter(obj):
+    # this is called for every key and leaf when dumping or fixing
+    # keys on a blob so resolve the isinstance chain once per type
+    t = type(obj)
+    try:
+        converter = _json_export_converter_cache[t]
+    except KeyError:
+        converter = next((c for cls, c in _json_export_converters
+                          if isinstance(obj, cls)), None)
+        _json_export_converter_cache[t] = converter
+
+    if converter is not None:
+        return converter(obj)
 
 
 class JEncode(json.JSONEncoder):
@@ -604,107 +627,69 @@ def zipeq(*iterables):
         yield zipped
 
 
-class JTList:
-    pass
-
+def _jt_all(blob):
+    """ transpose a list of dicts into a JT of lists keyed by the
+        union of their keys, other lists go in _list and leaves in _ """
+    # TODO alternatively if the schema is uniform, could use bc here ...
+    first = blob[0] if blob else None
+    if (first and isinstance(first, dict) and
+        all(isinstance(b, dict) and b.keys() == first.keys() for b in blob)):
+        # the usual shape, every element has the same keys so columns
+        # can be read directly without checking membership per cell
+        keys = set(k for k in first)  # same order as the general case
+        j = JT({k:[b[k] for b in blob] for k in keys})
+        setattr(j, '_b', blob)
+        return j
 
-class JTDict:
-    pass
+    keys = set(k for b in blob
+               if isinstance(b, dict)
+               for k in b)
+    obj = {k:[] for k in keys}
+    _list = []
+    _other = []
+    for b in blob:
+        if isinstance(b, dict):
+            for k in keys:
+                if k in b:
+                    obj[k].append(b[k])
+                else:
+                    obj[k].append(None)
 
+        elif any(isinstance(b, t) for t in (list, tuple)):
+            _list.append(JT(b))
 
-def JT(blob):
-    """ this is not a class but is a function hacked to work like one """
-    def _populate(blob, top=False):
-        if isinstance(blob, list) or isinstance(blob, tuple):
-            # TODO alternatively if the schema is uniform, could use bc here ...
-            def _all(self, l=blob):  # FIXME don't autocomplete?
-                keys = set(k for b in l
-                           if isinstance(b, dict)
-                           for k in b)
-                obj = {k:[] for k in keys}
-                _list = []
-                _other = []
-                for b in l:
-                    if isinstance(b, dict):
-                        for k in keys:
-                            if k in b:
-                                obj[k].append(b[k])
-                            else:
-                                obj[k].append(None)
-
-                    elif any(isinstance(b, t) for t in (list, tuple)):
-                        _list.append(JT(b))
+        else:
+            _other.append(b)
+            for k in keys:
+                obj[k].append(None)  # super inefficient
 
-                    else:
-                        _other.append(b)
-                        for k in keys:
-                            obj[k].append(None)  # super inefficient
+    if _list:
+        obj['_list'] = JT(_list)
 
-                if _list:
-                    obj['_list'] = JT(_list)
+    if obj:
+        j = JT(obj)
+    else:
+        j = JT(blob)
 
-                if obj:
-                    j = JT(obj)
-                else:
-                    j = JT(blob)
+    if _other:
+        #obj['_'] = _other  # infinite, though lazy
+        setattr(j, '_', _other)
 
-                if _other:
-                    #obj['_'] = _other  # infinite, though lazy
-                    setattr(j, '_', _other)
+    setattr(j, '_b', blob)
+    #lb = len(blob)
+    #setattr(j, '__len__', lambda: lb)  # FIXME len()
+    return j
 
-                setattr(j, '_b', blob)
-                #lb = len(blob)
-                #setattr(j, '__len__', lambda: lb)  # FIXME len()
-                return j
 
-            def it(self, l=blob):
-                for b in l:
-                    if any(isinstance(b, t) for t in (dict, list, tuple)):
-                        yield JT(b)
-                    else:
-                        yield b
+class JTBase:
+    """ attribute access to a json blob, nothing below the top level
+        is wrapped until it is accessed """
 
-            if top:
-                # FIXME iter is non homogenous
-                return [('__iter__', it), ('_all', property(_all))]
-            #elif not [e for e in b if isinstance(self, dict)]:
-                #return property(id)
-            else:
-                # FIXME this can render as {} if there are no keys
-                return property(_all)
-                #obj = {'_all': property(_all),
-                       #'_l': property(it),}
-
-                #j = JT(obj)
-                #return j
-
-                #nl = JT(obj)
-                #nl._list = blob
-                #return property(it)
-
-        elif isinstance(blob, dict):
-            if top:
-                out = [('_keys', tuple(blob))]
-                for k, v in blob.items():  # FIXME normalize keys ...
-                    nv = _populate(v)
-                    out.append((k, nv))
-                    #setattr(cls, k, nv)
-                return out
-            else:
-                return JT(blob)
+    def __init__(self, blob):
+        self._jt_blob = blob
 
-        else:
-            if top:
-                raise exc.UnhandledTypeError('asdf')
-            else:
-                @property
-                def prop(self, v=blob):
-                    return v
-
-                return prop
-
-    def _repr(self, b=blob):  # because why not
-        return 'JT(\n' + lj(b) + '\n)'
+    def __repr__(self):  # because why not
+        return 'JT(\n' + lj(self._jt_blob) + '\n)'
 
     def query(self, *path):
         """ returns None at first failure """
@@ -716,29 +701,62 @@ def JT(blob):
 
         return j
 
+
+class JTList(JTBase):
+
+    def __iter__(self):
+        # FIXME iter is non homogenous
+        for b in self._jt_blob:
+            if any(isinstance(b, t) for t in (dict, list, tuple)):
+                yield JT(b)
+            else:
+                yield b
+
+    @property
+    def _all(self):  # FIXME don't autocomplete?
+        return _jt_all(self._jt_blob)
+
+
+class JTDict(JTBase):
+
+    @property
+    def _keys(self):
+        return tuple(self._jt_blob)
+
+    def __getattr__(self, key):
+        # only called when normal lookup fails, read through __dict__
+        # so that a missing _jt_blob can't recurse
+        blob = self.__dict__.get('_jt_blob', {})
+        if key not in blob:
+            raise AttributeError(
+                f'{self.__class__.__name__!r} object has no attribute {key!r}')
+
+        value = blob[key]  # FIXME normalize keys ...
+        if isinstance(value, list) or isinstance(value, tuple):
+            # FIXME this can render as {} if there are no keys
+            return _jt_all(value)
+        elif isinstance(value, dict):
+            return JT(value)
+        else:
+            return value
+
+    def __dir__(self):
+        return [*super().__dir__(),
+                *(k for k in self._jt_blob if isinstance(k, str))]
+
+
+def JT(blob):
+    """ this is not a class but is a function hacked to work like one """
     # additional thought required for how to integrate these into this
     # shambling abomination
     #adops
     #dt = DictTransformer
-
-    #cd = {k:v for k, v in _populate(blob, True)}
-
-    # populate the top level
-    cd = {k:v for k, v in ((a, b) for t in _populate(blob, True)
-                           for a, b in (t if isinstance(t, list) else (t,)))}
-    cd['__repr__'] = _repr
-    cd['query'] = query
-
     if isinstance(blob, dict):
-        type_ = JTDict
-    elif isinstance(blob, list):
-        type_ = JTList
+        return JTDict(blob)
+    elif isinstance(blob, list) or isinstance(blob, tuple):
+        return JTList(blob)
     else:
-        type_ = object
-
-    nc = type('JT' + str(type(blob)), (type_,), cd)  # use object to prevent polution of ns
-    #nc = type('JT' + str(type(blob)), (type(blob),), cd)
-    return nc()
+        raise exc.UnhandledTypeError('asdf')
 
 
 class AtomicDictOperations:
@@ -1300,7 +1318,7 @@ class _DictTransformer:
             source = data
             failed = False
             for i, node_key in enumerate(source_prefixes):
-                log.debug(lj(source))
+                log.debug(LazyLJ(source))
                 if node_key in source:
                     source = source[node_key]
                 else:
@@ -1388,7 +1406,7 @@ class _DictTransformer:
             if not ok:
                 continue
 
-            log.debug(lj(selected_data))
+            log.debug(LazyLJ(selected_data))
             prepared.append((target_path, pipeline_class, DataWrapper(selected_data),
                              lifters, runtime_context))
 
@@ -1473,21 +1491,26 @@ def normalize_tabular_format(project_path):
 
 
 def extract_errors(thing, path=None):
-    """ recursively extract errors """
-    if path is None:
-        path = []
-
-    if isinstance(thing, dict):
-        for k, v in thing.items():
-            if k == 'errors':
-                for error in v:
-                    yield tuple(path), error
-            else:
-                yield from extract_errors(v, path + [k])
-
-    elif isinstance(thing, list):
-        for i, v in enumerate(thing):
-            yield from extract_errors(v, path + [i])
+    """ extract errors depth first in document order
+
+        uses an explicit stack because nested generators cost a frame
+        per level for every error yielded from deep in a blob """
+    stack = [(False, tuple() if path is None else tuple(path), thing)]
+    while stack:
+        is_errors, path, thing = stack.pop()
+        if is_errors:
+            for error in thing:
+                yield path, error
+
+        elif isinstance(thing, dict):
+            # reversed so that the first item is popped first
+            stack.extend((True, path, v) if k == 'errors' else
+                         (False, path + (k,), v)
+                         for k, v in reversed(thing.items()))
+
+        elif isinstance(thing, list):
+            stack.extend((False, path + (i,), thing[i])
+                         for i in range(len(thing) - 1, -1, -1))
 
 
 def get_all_errors(_with_errors):
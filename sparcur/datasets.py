@@ -2,6 +2,7 @@ import io
 import csv
 import copy
 from types import GeneratorType
+from functools import lru_cache
 from itertools import chain, zip_longest
 from collections import Counter, defaultdict
 #import openpyxl  # import time hog
@@ -34,7 +35,14 @@ def tos(hrm):
 
 def to_string_and_then_python_identifier(thing):
     """ handl cases where a header value isn't a string """
-    return python_identifier(str(thing))
+    return _python_identifier(str(thing))
+
+
+@lru_cache(maxsize=4096)
+def _python_identifier(string):
+    # the same few hundred header strings recur in every dataset
+    # and python_identifier runs several regex passes on each one
+    return python_identifier(string)
 
 
 hasSchema = sc.HasSchema()
@@ -9,7 +9,7 @@ from pyontutils.config import auth as pauth
 from pyontutils.core import OntId
 from pyontutils.utils import byCol
 from sparcur import normalization as nml
-from sparcur.core import log, logd, JEncode
+from sparcur.core import log, logd, JEncode, LazyLJ
 from sparcur.paths import Path
 #from sparcur.utils import cache
 from sparcur.config import config, auth
@@ -144,7 +144,7 @@ class OrganData:
                         award_list.append(former)  # for this usecase this is ok
                         self.former_to_current[former] = award
                 elif query:
-                    log.debug(lj(query))
+                    log.debug(LazyLJ(query))
             
         self.former_to_current = {nml.NormAward(nml.NormAward(k)):nml.NormAward(nml.NormAward(v))
                                   for k, v in self.former_to_current.items()}
@@ -13,6 +13,7 @@ from sparcur import export as ex
 from sparcur import schemas as sc
 from sparcur import curation as cur  # FIXME implicit state must be set in cli
 from sparcur import pipelines as pipes
+from sparcur import mcache
 from sparcur.core import JEncode, JFixKeys, adops, OntTerm
 from sparcur.paths import Path
 from sparcur.utils import symlink_latest, loge, logd, BlackfynnId
@@ -175,8 +176,7 @@ class ExportBase:
 
     @property
     def latest_export(self):
-        with open(self.latest_export_path, 'rt') as f:
-            return json.load(f)
+        return mcache.load(self.latest_export_path, json.load)
 
     @property
     def latest_ir(self):
@@ -309,8 +309,7 @@ class Export(ExportBase):
 
     @property
     def latest_protocols(self):
-        with open(self.latest_protocols_path, 'rt') as f:
-            return json.load(f)
+        return mcache.load(self.latest_protocols_path, json.load)
 
     @property
     def latest_protcur_path(self):
@@ -318,8 +317,7 @@ class Export(ExportBase):
 
     @property
     def latest_protcur(self):
-        with open(self.latest_protcur_path, 'rt') as f:
-            return json.load(f)
+        return mcache.load(self.latest_protcur_path, json.load)
 
     @property
     def latest_id_met_path(self):
@@ -327,8 +325,7 @@ class Export(ExportBase):
 
     @property
     def latest_id_met(self):
-        with open(self.latest_id_met_path, 'rt') as f:
-            return json.load(f)
+        return mcache.load(self.latest_id_met_path, json.load)
 
     @property
     def latest_datasets_path(self):
@@ -644,8 +641,7 @@ class Export(ExportBase):
 
         latest_id_met_path = latest_path / self.id_metadata
         if (self.latest and latest_id_met_path.exists()):
-            with open(latest_id_met_path, 'rt') as f:
-                blob_id_met = json.load(f)
+            blob_id_met = mcache.load(latest_id_met_path, json.load)
 
         else:
             import requests
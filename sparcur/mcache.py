@@ -0,0 +1,159 @@
+""" A persistent cache for parsed metadata files keyed on the sha256 of
+    the file contents so that repeated reports do not reparse the same
+    multi megabyte json exports on every invocation. """
+
+import os
+import time
+import pickle
+import hashlib
+from sparcur.utils import log
+from sparcur.config import auth
+
+_memory = {}  # key -> pickled bytes so callers always get a fresh object
+# limits are in bytes of pickled data since a single curation export
+# can be hundreds of megabytes, anything over a limit is not kept there
+_memory_maxbytes = 2 ** 27
+_disk_maxbytes = 2 ** 30
+_digests = {}  # stat signature -> sha256 so repeat loads skip rehashing
+_digests_maxsize = 64
+_racy_ns = 2 * 10 ** 9  # mtimes newer than this can't be trusted
+
+
+def cache_path():
+    return auth.get_path('cache-path') / 'mcache'
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # 3.11
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        m = hashlib.sha256()
+        for chunk in iter(lambda: f.read(2 ** 20), b''):
+            m.update(chunk)
+
+        return m.hexdigest()
+
+
+def _file_sha256(path):
+    """ file_sha256 memoized on the stat signature of path, files that
+        were modified too recently for mtime to be trusted are always
+        rehashed, the same way git treats racily clean entries """
+
+    st = os.stat(path)
+    sig = (os.fspath(path), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    if sig in _digests:
+        return _digests[sig]
+
+    digest = file_sha256(path)
+    if time.time_ns() - st.st_mtime_ns > _racy_ns:
+        _digests[sig] = digest
+        while len(_digests) > _digests_maxsize:
+            del _digests[next(iter(_digests))]
+
+    return digest
+
+
+def get(key):
+    """ return the cached object for key or raise KeyError """
+    if key in _memory:
+        return pickle.loads(_memory[key])
+
+    path = cache_path() / f'{key}.pkl'
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError as e:
+        raise KeyError(key) from e
+    except OSError as e:
+        log.warning(f'could not read metadata cache entry {path}\n{e}')
+        raise KeyError(key) from e
+
+    try:
+        obj = pickle.loads(data)
+    except Exception as e:
+        log.warning(f'corrupt metadata cache entry {path}\n{e}')
+        path.unlink(missing_ok=True)
+        raise KeyError(key) from e
+
+    _remember(key, data)
+    return obj
+
+
+def put(key, obj):
+    try:
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        log.warning(f'could not cache {key}\n{e}')
+        return
+
+    _remember(key, data)
+    if len(data) > _disk_maxbytes:
+        log.debug(f'not caching {key} to disk, {len(data)} bytes is too large')
+        return
+
+    base = cache_path()
+    path = base / f'{key}.pkl'
+    # unique per process so concurrent writers never share a temp file
+    temp = path.with_name(f'.{path.name}.{os.getpid()}')
+    try:
+        if not base.exists():
+            base.mkdir(parents=True)
+
+        temp.write_bytes(data)
+        temp.replace(path)
+        _prune(base)
+    except OSError as e:
+        # a cache must never turn a successful read into a failure
+        log.warning(f'could not write metadata cache entry {path}\n{e}')
+        try:
+            temp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def load(path, loader, kind='json'):
+    """ call loader on the open file at path unless there is already a
+        cached result for a file with the same contents """
+
+    key = f'{_file_sha256(path)}-{kind}'
+    try:
+        return get(key)
+    except KeyError:
+        pass
+
+    with open(path, 'rt') as f:
+        obj = loader(f)
+
+    put(key, obj)
+    return obj
+
+
+def _remember(key, data):
+    _memory.pop(key, None)
+    if len(data) > _memory_maxbytes:
+        # keeping it would evict everything else and hold a second
+        # copy of the largest objects in the process
+        return
+
+    _memory[key] = data
+    total = sum(len(d) for d in _memory.values())
+    while total > _memory_maxbytes:
+        total -= len(_memory.pop(next(iter(_memory))))
+
+
+def _prune(base):
+    """ remove the least recently written entries until the rest fit """
+    entries = []
+    for path in base.glob('*.pkl'):
+        try:
+            st = path.stat()
+        except FileNotFoundError:  # pruned by another process
+            continue
+
+        entries.append((st.st_mtime, st.st_size, path))
+
+    total = 0
+    for mtime, size, path in sorted(entries, key=lambda e: e[0], reverse=True):
+        total += size
+        if total > _disk_maxbytes:
+            path.unlink(missing_ok=True)
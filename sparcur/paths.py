@@ -1,3 +1,4 @@
+import os
 import ast
 import uuid
 import logging
@@ -1076,6 +1077,53 @@ class Path(aug.XopenPath, aug.RepoPath, aug.LocalPath, PathHelper):  # NOTE this
         return self._cache_class._id_class(
             self.cache_id, file_id=self.cache_file_id)
 
+    def fast_rchildren(self):
+        """ depth first traversal of all children using os.scandir
+
+            yields (entry, is_dir, is_symlink) where entry is an
+            os.DirEntry, the flags come from the cached dirent type
+            so no additional stat calls are made, wrap entry.path in
+            a path class only if you actually need one """
+
+        if not self.is_dir():
+            return
+
+        if (self.cache is not None and
+            self.cache.anchor and
+            self == self.cache.anchor.local):
+            # match rchildren which skips e.g. .operations at the anchor
+            # and which walks top level symlinked directories there
+            cache_ignore = self._cache_class.cache_ignore
+            follow = True
+        else:
+            cache_ignore = tuple()
+            follow = False
+
+        stack = [self.as_posix()]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except PermissionError:  # rglob skips these too
+                continue
+
+            with it:
+                entries = [e for e in it
+                           if not cache_ignore or
+                           os.path.splitext(e.name)[0] not in cache_ignore]
+
+            cache_ignore = tuple()  # only applies at the top level
+            subdirs = []
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_symlink = entry.is_symlink()
+                yield entry, is_dir, is_symlink
+                if is_dir or follow and is_symlink and entry.is_dir():
+                    subdirs.append(entry.path)
+
+            follow = False  # only applies at the top level
+
+            stack.extend(reversed(subdirs))
+
     def manifest_record(self, manifest_parent_path):
         filename = self.relative_path_from(manifest_parent_path)
         description = None
@@ -27,7 +27,7 @@ from sparcur import converters as conv
 from sparcur import exceptions as exc
 from sparcur import normalization as norm
 from sparcur.core import DictTransformer, copy_all, get_all_errors, compact_errors
-from sparcur.core import JT, JEncode, log, logd, lj, OntId, OntTerm, OntCuries
+from sparcur.core import JT, JEncode, log, logd, lj, LazyLJ, OntId, OntTerm, OntCuries
 from sparcur.core import json_identifier_expansion, dereference_all_identifiers
 from sparcur.core import JApplyRecursive, resolve_context_runtime, get_nested_by_key
 from sparcur.core import adops
@@ -253,7 +253,7 @@ class ContributorsPipeline(DatasourcePipeline):
             if member is not None:
                 s = userid
             else:
-                log.debug(lj(contributor))
+                log.debug(LazyLJ(contributor))
                 s = OntId(self.dsid + '/contributors/' + failover)
 
         contributor['id'] = s
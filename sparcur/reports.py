@@ -1,10 +1,11 @@
+import os
 import re
 import sys
 import json
 import types
 import pprint
 from pathlib import PurePath
-from itertools import chain, zip_longest
+from itertools import chain, zip_longest, groupby
 from collections import Counter, defaultdict
 import idlib, idlib.utils
 import htmlfn as hfn
@@ -54,6 +55,33 @@ def normtext(t, *, lower=False):
         return t
 
 
+def rfiles(paths):
+    """ all files under paths, the walk is metadata bound so
+        each top level child is expanded in its own thread """
+
+    def is_anchor(path):
+        # rchildren only recurses via children at the anchor, and only
+        # that walk follows symlinked top level directories
+        return (path.cache is not None and
+                path.cache.anchor and
+                path == path.cache.anchor.local)
+
+    def files(path, follow):
+        if path.is_dir():
+            if path.is_symlink() and not follow:
+                return []  # rglob does not descend into links
+
+            return [c for c in path.rchildren if not c.is_dir()]
+        else:
+            return [path]
+
+    subtrees = Async()(deferred(files)(c, follow)
+                       for p in paths if p.is_dir()
+                       for follow in (is_anchor(p),)
+                       for c in p.children)
+    return [c for cs in subtrees for c in cs]
+
+
 class SparqlQueries:
     """ Creates SPARQL query templates. """
 
@@ -312,12 +340,14 @@ class TtlFile:
 
 class Report:
 
-    @property
-    def _sort_key(self):
+    def _count_rows(self, counter, row):
+        """ row(k, v) for each counter item in report order """
         if self.options.sort_count_desc:
-            return lambda kv: -kv[-1]
+            # most_common is the same stable count order without
+            # calling a python key function for every row
+            return [row(k, v) for k, v in counter.most_common()]
         else:
-            return lambda kv: kv
+            return sorted(row(k, v) for k, v in counter.items())
 
     def __init__(self, *args, **kwargs):
         from sparcur.curation import ExporterSummarizer
@@ -469,19 +499,36 @@ class Report:
             if not Path(d).is_dir():
                 continue  # helper files at the top level, and the symlinks that destory python
             path = Path(d).resolve()
-            paths = path.rchildren #list(path.rglob('*'))
-            path_meta = {p:p.cache.meta if p.cache else dead(p) for p in paths
-                         if p.suffix not in ('.swp',)}
             outstanding = 0
             total = 0
             tf = 0
             ff = 0
             td = 0
             uncertain = False  # TODO
-            for p, m in path_meta.items():
+            # stream over dirents instead of rchildren so that the
+            # file type checks below mostly come from scandir for free
+            for entry, is_dir, is_symlink in path.fast_rchildren():
+                if entry.name.endswith('.swp'):
+                    continue
+
+                p = Path(entry.path)
+                cache = p.cache
+                if not cache:
+                    dead(p)
+
+                if is_symlink:
+                    is_broken = not os.path.exists(entry.path)
+                    is_file = not is_broken and entry.is_file()
+                    is_dir = not is_broken and entry.is_dir()
+                else:
+                    is_broken = False
+                    is_file = not is_dir and entry.is_file(follow_symlinks=False)
+
                 #if p.is_file() and not any(p.stem.startswith(pf) for pf in self.spcignore):
-                if p.is_file() or p.is_broken_symlink():
-                    s = m.size
+                if is_file or is_broken:
+                    # only files need the metadata so directories
+                    # skip the xattr read and parse entirely
+                    s = cache.meta.size
                     if s is None:
                         uncertain = True
                         continue
@@ -491,12 +538,12 @@ class Report:
                         total += s
 
                     #if '.fake' in p.suffixes:
-                    if p.is_broken_symlink():
+                    if is_broken:
                         ff += 1
                         if s:
                             outstanding += s
 
-                elif p.is_dir():
+                elif is_dir:
                     td += 1
 
             data.append([path.name,
@@ -520,28 +567,33 @@ class Report:
     # TODO generator issue
     #@sheets.Reports.makeReportSheet('suffix', 'mimetype', 'magic_mimetype')
     def filetypes(self, ext=None):
-        key = self._sort_key
         paths = self.paths if self.paths else (self.cwd,)
-        paths = [c for p in paths for c in p.rchildren if not c.is_dir()]
+        paths = rfiles(paths)
         rex = re.compile('^\.[0-9][0-9][0-9A-Z]$')
-        rex_paths = [p for p in paths if re.match(rex, p.suffix)]
-        paths = [p for p in paths if not re.match(rex, p.suffix)]
-
-        def count(thing):
-            return sorted([(k if k else '', v) for k, v in
-                            Counter([getattr(f, thing)
-                                     for f in paths]).items()], key=key)
-
-        each = {t:count(t) for t in ('suffix', 'mimetype', '_magic_mimetype')}
-        each['suffix'].append((rex.pattern, len(rex_paths)))
+        # mimetypes are expensive so read each attribute once per path
+        # and derive the single column counts from the joint counts,
+        # tallying from a generator keeps the counting itself in C
+        joint = Counter(None if rex.match(p.suffix) else
+                        (p.suffix, p.mimetype, p._magic_mimetype)
+                        for p in paths)
+        n_rex = joint.pop(None, 0)
+
+        titles = ('suffix', 'mimetype', '_magic_mimetype')
+        marginals = [Counter() for _ in titles]
+        for k, v in joint.items():
+            for marginal, m in zip(marginals, k):
+                marginal[m] += v
+
+        each = {title:self._count_rows(marginal, lambda k, v: (k if k else '', v))
+                for title, marginal in zip(titles, marginals)}
+        each['suffix'].append((rex.pattern, n_rex))
 
         for title, rows in each.items():
             yield self._print_table(((title, 'count'), *rows),
                                     title=title.replace('_', ' ').strip())
 
-        all_counts = sorted([(*[m if m else '' for m in k], v) for k, v in
-                             Counter([(f.suffix, f.mimetype, f._magic_mimetype)
-                                      for f in paths]).items()], key=key)
+        all_counts = self._count_rows(
+            joint, lambda k, v: (*[m if m else '' for m in k], v))
 
         header = ['suffix', 'mimetype', 'magic mimetype', 'count']
         return self._print_table((header, *all_counts),
@@ -551,21 +603,17 @@ class Report:
     def _s(self, dict_key, ext=None):
         data = self._data_ir()
         datasets = data['datasets']
-        key = self._sort_key
         # FIXME we need the blob wrapper in addition to the blob generator
         # FIXME these are the normalized ones ...
-        s_headers = tuple(
+        s_headers = Counter(
             uk for dataset_blob in datasets
             if dict_key in dataset_blob  # FIXME inputs?
             # unique so that we don't bias by the number of specimens
             # in a given study, there is an issue with sparse
             # reporting over different specimens in the same study,
             # but not much we can do about that
-            for uk in set(
-                    k for s_blob in dataset_blob[dict_key]
-                    for k in s_blob))
-        counts = tuple(kv for kv in sorted(Counter(s_headers).items(),
-                                            key=key))
+            for uk in set().union(*dataset_blob[dict_key]))
+        counts = tuple(self._count_rows(s_headers, lambda k, v: (k, v)))
 
         index_col_name = 'Column Name'
         if ext is None:
@@ -700,12 +748,16 @@ class Report:
     def keywords(self, ext=None):
         data = self._data_ir()
         datasets = data['datasets']
-        _rows = [sorted(set(dataset_blob.get('meta', {}).get('keywords', [])),
+        # dedupe adjacent runs after sorting instead of hashing every
+        # keyword and then every row, this also makes the order of
+        # keywords with the same length stable between runs
+        _rows = [sorted((k for k, _ in groupby(sorted(
+            dataset_blob.get('meta', {}).get('keywords', [])))),
                         key=lambda v: -len(v))
                     for dataset_blob in datasets]
-        rows = [list(r) for r in sorted(
-            set(tuple(r) for r in _rows if r),
-            key = lambda r: (len(r), tuple(len(c) for c in r if c), r))]
+        rows = [list(r) for r, _ in groupby(sorted(
+            (tuple(r) for r in _rows if r),
+            key = lambda r: (len(r), tuple(len(c) for c in r if c), r)))]
         header = [[f'{i + 1}' for i, _ in enumerate(rows[-1])]] if rows else []
         rows = header + rows
         return self._print_table(rows,
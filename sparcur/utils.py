@@ -1,8 +1,11 @@
 import os
 import re
 import sys
+import math
+import time
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED
 import idlib
 from idlib.utils import log as _ilog
 from augpathlib.utils import log as _alog
@@ -337,14 +340,18 @@ def symlink_latest(dump_path, path, relative=True):
     if relative:
         dump_path = dump_path.relative_path_from(path)
 
-    if path.exists():
-        if not path.is_symlink():
-            raise TypeError(f'Why is {path.name} not a symlink? '
-                            f'{path!r}')
+    if path.exists() and not path.is_symlink():
+        raise TypeError(f'Why is {path.name} not a symlink? '
+                        f'{path!r}')
 
-        path.unlink()
+    # make the new link next to the old one and rename it into place
+    # so that readers following path never find it missing
+    temp = path.with_name(f'.{path.name}.{os.getpid()}')
+    if temp.is_symlink():  # left over from a crashed run with our pid
+        temp.unlink()
 
-    path.symlink_to(dump_path)
+    temp.symlink_to(dump_path)
+    os.replace(temp, path)
 
 
 def _transitive_(path, command, skip_first=False):
@@ -407,6 +414,59 @@ def unicode_truncate(string, length):
     return string.encode()[:length].decode(errors='ignore')
 
 
+class BatchedFetcher:
+    """ Run deferred calls on a thread pool with a bounded window of
+        calls in flight instead of materializing and chunking all of
+        them up front. Submissions are paced to at most rate per second
+        and results are returned in submission order. """
+
+    def __init__(self, rate=None, window=16):
+        if window < 1:
+            raise ValueError(f'window must be at least 1 not {window}')
+
+        self.rate = rate
+        self.window = window
+
+    def __call__(self, generator):
+        if self.rate:
+            # same worker cap as pyontutils.utils.Async
+            workers = math.ceil(self.rate) if self.rate < 40 else 40
+            interval = 1 / self.rate
+        else:
+            workers = None
+            interval = 0
+
+        results = []
+        in_flight = {}  # future -> index of its slot in results
+
+        def reap(return_when):
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                results[in_flight.pop(future)] = future.result()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            next_submit = time.monotonic()
+            for func in generator:
+                if len(in_flight) >= self.window:
+                    # refill as soon as any call finishes so that one
+                    # slow call does not stall the rest of the window
+                    reap(FIRST_COMPLETED)
+
+                now = time.monotonic()
+                if now < next_submit:
+                    time.sleep(next_submit - now)
+                    now = next_submit
+
+                next_submit = now + interval
+                in_flight[executor.submit(func)] = len(results)
+                results.append(None)
+
+            if in_flight:
+                reap(ALL_COMPLETED)
+
+        return results
+
+
 class ApiWrapper:
     """ Sometimes you just need one more level of indirection!
     Abstract base class to wrap Blackfynn and Pennsieve apis.
@@ -0,0 +1,117 @@
+import unittest
+from docopt import docopt
+from sparcur import cli
+
+
+class TestPrefilterUsage(unittest.TestCase):
+
+    argvs = (
+        ['configure'],
+        ['pull', 'a', 'b'],
+        ['refresh', '-f', 'x'],
+        ['find', '--name', '*.xlsx', '--name', '*.csv'],
+        ['meta', '-u'],
+        ['export', 'protcur'],
+        ['report', 'size', 'p'],
+        ['report', 'anno-tags', 't1', 't2'],
+        ['shell', 'dates', 'x'],
+        ['feedback', 'f', 'a', 'b'],
+        ['--version'],
+    )
+
+    def test_same_as_full(self):
+        for argv in self.argvs:
+            if argv[0].startswith('-'):
+                assert cli._prefilter_usage(argv, cli.__doc__) is cli.__doc__
+                continue
+
+            full = docopt(cli.__doc__, argv=argv)
+            reduced = cli._docopt(cli.__doc__, argv)
+            assert full == reduced, argv
+
+    def test_unknown_command(self):
+        assert cli._prefilter_usage(['not-a-command'], cli.__doc__) is cli.__doc__
+
+
+class TestProbe(unittest.TestCase):
+
+    def test_probe(self):
+        import os
+        import shutil
+        import tempfile
+        base = tempfile.mkdtemp()
+        try:
+            d = os.path.join(base, 'd')
+            f = os.path.join(base, 'f')
+            os.mkdir(d)
+            with open(f, 'wb') as fd:
+                fd.write(b'12345')
+
+            os.symlink(f, os.path.join(base, 'lf'))
+            os.symlink(d, os.path.join(base, 'ld'))
+            os.symlink('nothing', os.path.join(base, 'broken'))
+            expect = {  # exists is_dir is_symlink is_broken
+                'd': (True, True, False, False),
+                'f': (True, False, False, False),
+                'lf': (True, False, True, False),
+                'ld': (True, True, True, False),
+                'broken': (False, False, True, True),
+            }
+            for name, flags in expect.items():
+                pr = cli._probe(os.path.join(base, name))
+                assert (pr.exists, pr.is_dir, pr.is_symlink, pr.is_broken) == flags, name
+
+            assert cli._probe(os.path.join(base, 'lf')).size == 5
+        finally:
+            shutil.rmtree(base)
+
+
+class TestLazyMap(unittest.TestCase):
+
+    def test_lazy(self):
+        calls = []
+        def f(x):
+            calls.append(x)
+            return x * 2
+
+        m = cli._LazyMap(f, (1, 2, 3))
+        assert not calls
+        assert m[-1] == 6 and m[2] == 6
+        assert calls == [3]
+        assert list(m) == [2, 4, 6]
+        assert m[:2] == [2, 4]
+        assert calls == [3, 1, 2]
+
+
+class TestFindFiles(unittest.TestCase):
+
+    def test_same_as_rglob(self):
+        import os
+        import shutil
+        import tempfile
+        from sparcur.paths import Path
+        base = Path(tempfile.mkdtemp())
+        elsewhere = Path(tempfile.mkdtemp())
+        try:
+            (elsewhere / 'linked.xlsx').touch()
+            (base / 'a' / 'b').mkdir(parents=True)
+            (base / 'dir.csv').mkdir()  # directories are dropped
+            for name in ('x.xlsx', 'a/y.csv', 'a/b/z1.txt', 'a/b/zz.txt',
+                         'a/.hidden.csv', '.dot.xlsx', 'a/b/Upper.CSV',
+                         'a/b/data_3.dat'):
+                (base / name).touch()
+
+            os.symlink(elsewhere, base / 'a' / 'linkdir')
+            os.symlink(base / 'nothing.csv', base / 'a' / 'broken.csv')
+            for pats in (['*.xlsx'],
+                         ['*.xlsx', '*.csv'],
+                         ['z?.txt', '*_[0-9].dat'],
+                         ['[!x]*.xlsx', '*.CSV'],
+                         ['.*'],
+                         ['nomatch']):
+                expect = {p for pat in pats for p in base.rglob(pat)
+                          if not p.is_dir()}
+                assert set(cli.Main._find_files(base, pats)) == expect, pats
+        finally:
+            shutil.rmtree(base)
+            shutil.rmtree(elsewhere)
@@ -1,5 +1,5 @@
 import unittest
-from sparcur.core import adops, DictTransformer
+from sparcur.core import adops, DictTransformer, JT, JTList, extract_errors
 from sparcur.derives import Derives as De
 
 
@@ -274,3 +274,70 @@ class TestDictTransformer(ExamplesDT, Populator, unittest.TestCase):
     to_test = DictTransformer
     apply = False
 TestDictTransformer.populate()
+
+
+class TestJT(unittest.TestCase):
+
+    blob = {'id': 'a',
+            'status': {'error_index': 3},
+            'meta': {'folder_name': 'f',
+                     'list': [{'a': 1}, {'b': 2}, 3]}}
+
+    def test_access(self):
+        j = JT(self.blob)
+        assert j.id == 'a'
+        assert j.status.error_index == 3
+        assert j._keys == ('id', 'status', 'meta')
+        assert j.query('meta', 'folder_name') == 'f'
+        assert j.query('meta', 'nope', 'deeper') is None
+        assert not hasattr(j, 'nope')
+        assert 'status' in dir(j)
+
+    def test_list(self):
+        l = JT(self.blob).meta.list
+        assert l.a._jt_blob == [1, None, None]
+        assert l._ == [3]
+        assert l._b is self.blob['meta']['list']
+        assert [x if isinstance(x, int) else x._keys
+                for x in JT(self.blob['meta']['list'])] == [('a',), ('b',), 3]
+
+    def test_list_uniform(self):
+        blob = [{'a': 1, 'b': 2}, {'b': 4, 'a': 3}]
+        l = JT({'l': blob}).l
+        assert l.a._jt_blob == [1, 3]
+        assert l.b._jt_blob == [2, 4]
+        assert l._b is blob
+        assert not hasattr(l, '_')
+
+    def test_list_empty_dicts(self):
+        blob = [{}, {}]
+        l = JT({'l': blob}).l
+        assert isinstance(l, JTList)
+        assert l._b is blob
+
+
+class TestExtractErrors(unittest.TestCase):
+
+    blob = {'errors': [{'message': 'top'}],
+            'a': {'b': [{'errors': [{'message': 'a0'}, {'message': 'a1'}]},
+                        'leaf',
+                        [{'errors': [{'message': 'nested'}]}]],
+                  'errors': [{'message': 'a'}]},
+            'c': [],
+            'd': {'errors': [{'message': 'd'}]}}
+
+    expect = [((), {'message': 'top'}),
+              (('a', 'b', 0), {'message': 'a0'}),
+              (('a', 'b', 0), {'message': 'a1'}),
+              (('a', 'b', 2, 0), {'message': 'nested'}),
+              (('a',), {'message': 'a'}),
+              (('d',), {'message': 'd'})]
+
+    def test_order(self):
+        assert list(extract_errors(self.blob)) == self.expect
+
+    def test_path(self):
+        prefix = ['datasets', 3]
+        assert list(extract_errors(self.blob, prefix)) == [
+            ((*prefix, *path), error) for path, error in self.expect]
+        assert prefix == ['datasets', 3]
@@ -0,0 +1,127 @@
+import os
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from sparcur import mcache
+
+
+class TestMCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.temp = Path(self._tempdir.name)
+        self._cache_path = mcache.cache_path
+        mcache.cache_path = lambda: self.temp / 'mcache'
+        mcache._memory.clear()
+        mcache._digests.clear()
+
+    def tearDown(self):
+        mcache.cache_path = self._cache_path
+        mcache._memory.clear()
+        mcache._digests.clear()
+        self._tempdir.cleanup()
+
+    def test_load(self):
+        path = self.temp / 'export.json'
+        blob = {'datasets': [{'id': 'a'}, {'id': 'b'}]}
+        path.write_text(json.dumps(blob))
+        calls = []
+        def loader(f):
+            calls.append(True)
+            return json.load(f)
+
+        assert mcache.load(path, loader) == blob
+        assert mcache.load(path, loader) == blob
+        assert len(calls) == 1
+
+        mcache._memory.clear()  # from disk
+        assert mcache.load(path, loader) == blob
+        assert len(calls) == 1
+
+        path.write_text(json.dumps({'datasets': []}))
+        assert mcache.load(path, loader) == {'datasets': []}
+        assert len(calls) == 2
+
+    def test_fresh_copies(self):
+        mcache.put('key', {'a': [1]})
+        one = mcache.get('key')
+        one['a'].append(2)
+        assert mcache.get('key') == {'a': [1]}
+
+    def test_unwritable(self):
+        path = self.temp / 'export.json'
+        path.write_text(json.dumps({'datasets': []}))
+        not_a_dir = self.temp / 'file'
+        not_a_dir.write_text('')
+        mcache.cache_path = lambda: not_a_dir / 'mcache'
+        assert mcache.load(path, json.load) == {'datasets': []}
+        mcache._memory.clear()
+        assert mcache.load(path, json.load) == {'datasets': []}
+
+    def test_memory_bytes(self):
+        maxbytes = mcache._memory_maxbytes
+        size = len(pickle.dumps('x' * 100, protocol=pickle.HIGHEST_PROTOCOL))
+        mcache._memory_maxbytes = size * 2
+        try:
+            for i in range(3):
+                mcache.put(f'k{i}', f'{i}' * 100)
+
+            assert list(mcache._memory) == ['k1', 'k2']
+            mcache.put('big', 'x' * 1000)
+            assert 'big' not in mcache._memory
+            assert list(mcache._memory) == ['k1', 'k2']
+            assert mcache.get('big') == 'x' * 1000  # from disk
+        finally:
+            mcache._memory_maxbytes = maxbytes
+
+    def test_disk_bytes(self):
+        maxbytes = mcache._disk_maxbytes
+        size = len(pickle.dumps('x' * 100, protocol=pickle.HIGHEST_PROTOCOL))
+        mcache._disk_maxbytes = size * 2
+        base = mcache.cache_path()
+        try:
+            for i in range(3):
+                mcache.put(f'k{i}', f'{i}' * 100)
+                # mtime resolution can be coarse, make the order explicit
+                os.utime(base / f'k{i}.pkl', (i, i))
+
+            mcache._prune(base)
+            assert sorted(p.stem for p in base.glob('*.pkl')) == ['k1', 'k2']
+            mcache.put('big', 'x' * 1000)
+            assert not (base / 'big.pkl').exists()
+        finally:
+            mcache._disk_maxbytes = maxbytes
+
+    def test_missing(self):
+        with self.assertRaises(KeyError):
+            mcache.get('nope')
+
+    def test_digest_reuse(self):
+        path = self.temp / 'export.json'
+        path.write_text(json.dumps({'datasets': []}))
+        calls = []
+        file_sha256 = mcache.file_sha256
+        def counting(p):
+            calls.append(True)
+            return file_sha256(p)
+
+        mcache.file_sha256 = counting
+        try:
+            # too new to trust
+            mcache.load(path, json.load)
+            mcache.load(path, json.load)
+            assert len(calls) == 2
+
+            old = path.stat().st_mtime - 60
+            os.utime(path, (old, old))
+            mcache.load(path, json.load)
+            mcache.load(path, json.load)
+            assert len(calls) == 3
+
+            path.write_text(json.dumps({'datasets': [{'id': 'a'}]}))
+            assert mcache.load(path, json.load) == {'datasets': [{'id': 'a'}]}
+            assert len(calls) == 4
+        finally:
+            mcache.file_sha256 = file_sha256
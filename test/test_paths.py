@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sparcur.paths import Path
+from .common import project_path
+
+
+def populate(base, elsewhere):
+    (base / 'd' / 'e').mkdir(parents=True)
+    (base / 'd' / 'f.txt').touch()
+    (base / 'd' / 'e' / '.hidden').touch()
+    (base / '.dotfile').touch()
+    os.symlink(elsewhere, base / 'd' / 'linkdir')
+    os.symlink(base / 'nothing', base / 'd' / 'broken')
+
+
+class TestFastRChildren(unittest.TestCase):
+
+    def setUp(self):
+        self.elsewhere = Path(tempfile.mkdtemp())
+        (self.elsewhere / 'g.txt').touch()
+        self.temp = Path(tempfile.mkdtemp())
+        self.added = []
+
+    def tearDown(self):
+        shutil.rmtree(self.elsewhere)
+        shutil.rmtree(self.temp)
+        for path in self.added:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+    def _check(self, base):
+        expect = {c: (c.is_dir() and not c.is_symlink(), c.is_symlink())
+                  for c in base.rchildren}
+        fast = {Path(entry.path): (is_dir, is_symlink)
+                for entry, is_dir, is_symlink in base.fast_rchildren()}
+        assert fast == expect, set(fast) ^ set(expect)
+        return fast
+
+    def test_plain(self):
+        base = self.temp / 'base'
+        populate(base, self.elsewhere)
+        fast = self._check(base)
+        assert base / 'd' / 'broken' in fast
+        assert base / 'd' / 'e' / '.hidden' in fast
+        assert base / 'd' / 'linkdir' / 'g.txt' not in fast
+
+    def test_anchor(self):
+        base = project_path
+        names = 'd', '.dotfile', '.git', '.sparse.txt', 'toplink'
+        self.added = [base / n for n in names]
+        populate(base, self.elsewhere)
+        os.symlink(self.elsewhere, base / 'toplink')
+        (base / '.git').mkdir()
+        (base / '.git' / 'config').touch()
+        (base / '.sparse.txt').touch()
+        fast = self._check(base)
+        assert base / '.git' / 'config' not in fast
+        assert base / '.sparse.txt' not in fast
+        assert base / '.operations' not in fast
+        assert base / '.dotfile' in fast
+        # rchildren walks top level links at the anchor
+        assert base / 'toplink' / 'g.txt' in fast
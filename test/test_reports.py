@@ -0,0 +1,33 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sparcur.paths import Path
+from sparcur.reports import rfiles
+
+
+class TestRFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = Path(tempfile.mkdtemp())
+        self.elsewhere = Path(tempfile.mkdtemp())
+        (self.elsewhere / 'g.txt').touch()
+        base = self.temp / 'root'
+        (base / 'd' / 'e').mkdir(parents=True)
+        (base / 'd' / 'f.txt').touch()
+        (base / 'd' / 'e' / 'h').touch()
+        (base / '.hidden').touch()
+        (base / 'top.csv').touch()
+        os.symlink(self.elsewhere, base / 'linkdir')
+        os.symlink(self.elsewhere, base / 'd' / 'inner')
+        os.symlink(base / 'nothing', base / 'broken')
+        self.base = base
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+        shutil.rmtree(self.elsewhere)
+
+    def test_same_as_rchildren(self):
+        expect = sorted(c for c in self.base.rchildren if not c.is_dir())
+        assert sorted(rfiles([self.base])) == expect
+        assert self.base / 'linkdir' / 'g.txt' not in expect
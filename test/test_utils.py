@@ -3,7 +3,7 @@ import pickle
 import unittest
 import pytest
 import idlib
-from sparcur.utils import BlackfynnId, PennsieveId
+from sparcur.utils import BlackfynnId, PennsieveId, BatchedFetcher, symlink_latest
 from idlib.streams import HelpTestStreams
 
 
@@ -89,3 +89,100 @@ class TestPennsieveId(TestBlackfynnId):
 class TestIdlibPennsieveId(HelpTestStreams, unittest.TestCase):
     stream = PennsieveId
     ids = TestPennsieveId.cases
+
+
+class TestBatchedFetcher(unittest.TestCase):
+
+    def test_order(self):
+        import time
+        import random
+        def make(i):
+            def inner():
+                time.sleep(random.random() / 100)
+                return i
+
+            return inner
+
+        n = 50
+        results = BatchedFetcher(window=4)(make(i) for i in range(n))
+        assert results == list(range(n))
+
+    def test_window(self):
+        import time
+        import threading
+        lock = threading.Lock()
+        state = {'now': 0, 'max': 0}
+        def work():
+            with lock:
+                state['now'] += 1
+                state['max'] = max(state['max'], state['now'])
+
+            time.sleep(0.01)  # stay in flight so calls overlap
+            with lock:
+                state['now'] -= 1
+
+        BatchedFetcher(window=3)(work for _ in range(30))
+        assert 1 < state['max'] <= 3
+
+    def test_uneven(self):
+        import time
+        def make(i):
+            def inner():
+                time.sleep(0.2 if i % 10 == 0 else 0.01)
+                return i
+
+            return inner
+
+        # a slow call must not hold up submissions behind it, waiting on
+        # the oldest call serializes the slow ones and takes over 0.8s
+        start = time.monotonic()
+        results = BatchedFetcher(window=4)(make(i) for i in range(40))
+        elapsed = time.monotonic() - start
+        assert results == list(range(40))
+        assert elapsed < 0.6, elapsed
+
+    def test_bad_window(self):
+        for window in (0, -1):
+            with pytest.raises(ValueError):
+                BatchedFetcher(window=window)
+
+    def test_empty(self):
+        assert BatchedFetcher(rate=5)(iter(())) == []
+
+    def test_error(self):
+        def bad():
+            raise ValueError('oops')
+
+        with pytest.raises(ValueError):
+            BatchedFetcher(rate=100)([bad])
+
+
+class TestSymlinkLatest(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        from sparcur.paths import Path
+        self.base = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.base)
+
+    def test_replace(self):
+        first, second = self.base / 'first', self.base / 'second'
+        first.mkdir()
+        second.mkdir()
+        latest = self.base / 'LATEST'
+        symlink_latest(first, latest)
+        assert latest.resolve() == first.resolve()
+        symlink_latest(second, latest)
+        assert latest.resolve() == second.resolve()
+        assert sorted(p.name for p in self.base.iterdir()) == ['LATEST', 'first', 'second']
+
+    def test_not_a_symlink(self):
+        dump = self.base / 'dump'
+        dump.mkdir()
+        latest = self.base / 'LATEST'
+        latest.mkdir()
+        with pytest.raises(TypeError):
+            symlink_latest(dump, latest)